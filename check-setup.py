@@ -1,13 +1,7 @@
 import argparse
-import importlib
-import warnings
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
-MODULE_IMPORT_NAMES = {
-    "PyYAML": "yaml",
-    "mypy": "mypy.version",
-}
-
 IGNORE_MODULES = {"pre-commit"}
 
 
@@ -35,13 +29,8 @@ def get_info_dependencies():
         if name in IGNORE_MODULES:
             continue
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                import_name = MODULE_IMPORT_NAMES.get(name, name)
-                module = importlib.import_module(import_name)
-
-            module_version = getattr(module, "__version__", "no version info found")
-        except ImportError:
+            module_version = version(name)
+        except PackageNotFoundError:
             module_version = "not installed"
         info[name] = module_version
 
@@ -50,12 +39,9 @@ def get_info_dependencies():
 
 def print_info(info, title):
     """Print info."""
-    info_all = f"\n{title}:\n\n"
-
-    for key, value in info.items():
-        info_all += f"\t{key:22s} : {value:<10s} \n"
-
-    print(info_all + "\n")
+    lines = [f"\n{title}:\n"]
+    lines += [f"\t{key:22s} : {value:<10s} " for key, value in info.items()]
+    print("\n".join(lines) + "\n\n")
 
 
 if __name__ == "__main__":